@@ -11,18 +11,12 @@ Public API:
     HashiCorpVaultBackend: HashiCorp Vault backend
     register_backend: Register custom secret backend
     get_backend: Get registered backend by name
+
+Public names are imported lazily on first attribute access so that
+``import envcraft`` does not pull in pydantic until it is actually needed.
 """
 
-from .config import EnvCraft, Secret
-from .backends import (
-    SecretBackend,
-    EnvBackend,
-    AWSSecretsBackend,
-    AzureKeyVaultBackend,
-    HashiCorpVaultBackend,
-    register_backend,
-    get_backend,
-)
+from importlib import import_module
 
 __version__ = "0.1.0"
 __all__ = [
@@ -36,3 +30,30 @@ __all__ = [
     "register_backend",
     "get_backend",
 ]
+
+# Maps each public name to the submodule that defines it
+_LAZY = {
+    "EnvCraft": ".config",
+    "Secret": ".config",
+    "SecretBackend": ".backends",
+    "EnvBackend": ".backends",
+    "AWSSecretsBackend": ".backends",
+    "AzureKeyVaultBackend": ".backends",
+    "HashiCorpVaultBackend": ".backends",
+    "register_backend": ".backends",
+    "get_backend": ".backends",
+}
+
+
+def __getattr__(name):
+    """Import public names from their submodule on first access"""
+    module_name = _LAZY.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
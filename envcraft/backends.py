@@ -1,7 +1,16 @@
 from abc import ABC, abstractmethod
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Callable, List
 import os
 
+# Cloud SDK modules, imported on first use and shared across backend instances
+_boto3 = None
+_azure_secrets = None
+_azure_identity = None
+_hvac = None
+
+# Values parsed from env files by EnvCraft.load(), which no longer copies them into os.environ
+_env_file_values: Dict[str, str] = {}
+
 
 class SecretBackend(ABC):
     """Base class for secret backend plugins"""
@@ -10,6 +19,10 @@ class SecretBackend(ABC):
     def get_secret(self, key: str) -> str:
         """Retrieve a secret value by key"""
         pass
+    
+    def get_secrets(self, keys: List[str]) -> Dict[str, str]:
+        """Retrieve several secrets; override to fetch them in one round-trip"""
+        return {key: self.get_secret(key) for key in keys}
 
 
 class AWSSecretsBackend(SecretBackend):
@@ -19,19 +32,58 @@ class AWSSecretsBackend(SecretBackend):
         self.region = region
         self._client = None
     
-    def get_secret(self, key: str) -> str:
+    def _get_client(self):
         if self._client is None:
-            try:
-                import boto3
-                self._client = boto3.client('secretsmanager', region_name=self.region)
-            except ImportError:
-                raise ImportError("boto3 is required for AWS Secrets Manager. Install with: pip install boto3")
+            global _boto3
+            if _boto3 is None:
+                try:
+                    import boto3
+                except ImportError:
+                    raise ImportError("boto3 is required for AWS Secrets Manager. Install with: pip install boto3")
+                _boto3 = boto3
+            self._client = _boto3.client('secretsmanager', region_name=self.region)
+        return self._client
+    
+    def get_secret(self, key: str) -> str:
+        client = self._get_client()
         
         try:
-            response = self._client.get_secret_value(SecretId=key)
+            response = client.get_secret_value(SecretId=key)
             return response['SecretString']
         except Exception as e:
             raise ValueError(f"Failed to retrieve secret '{key}' from AWS Secrets Manager: {e}")
+    
+    def get_secrets(self, keys: List[str]) -> Dict[str, str]:
+        client = self._get_client()
+        if not hasattr(client, 'batch_get_secret_value'):
+            # boto3 releases before BatchGetSecretValue support, fetch one at a time
+            return super().get_secrets(keys)
+        
+        found = {}
+        errors = []
+        try:
+            # BatchGetSecretValue accepts at most 20 ids per request
+            for start in range(0, len(keys), 20):
+                request = {'SecretIdList': keys[start:start + 20]}
+                while True:
+                    response = client.batch_get_secret_value(**request)
+                    for secret in response.get('SecretValues', []):
+                        found[secret['Name']] = secret['SecretString']
+                        if 'ARN' in secret:
+                            found[secret['ARN']] = secret['SecretString']
+                    errors.extend(response.get('Errors', []))
+                    if not response.get('NextToken'):
+                        break
+                    request['NextToken'] = response['NextToken']
+        except Exception as e:
+            raise ValueError(f"Failed to retrieve secrets {keys} from AWS Secrets Manager: {e}")
+        
+        if errors:
+            details = ', '.join(f"'{err.get('SecretId')}': {err.get('Message')}" for err in errors)
+            raise ValueError(f"Failed to retrieve secrets from AWS Secrets Manager: {details}")
+        
+        # Results carry the name and full ARN, so partial ARNs are fetched individually
+        return {key: found[key] if key in found else self.get_secret(key) for key in keys}
 
 
 class AzureKeyVaultBackend(SecretBackend):
@@ -43,12 +95,18 @@ class AzureKeyVaultBackend(SecretBackend):
     
     def get_secret(self, key: str) -> str:
         if self._client is None:
-            try:
-                from azure.keyvault.secrets import SecretClient
-                from azure.identity import DefaultAzureCredential
-                self._client = SecretClient(vault_url=self.vault_url, credential=DefaultAzureCredential())
-            except ImportError:
-                raise ImportError("azure-keyvault-secrets and azure-identity are required. Install with: pip install azure-keyvault-secrets azure-identity")
+            global _azure_secrets, _azure_identity
+            if _azure_secrets is None or _azure_identity is None:
+                try:
+                    import azure.keyvault.secrets
+                    import azure.identity
+                except ImportError:
+                    raise ImportError("azure-keyvault-secrets and azure-identity are required. Install with: pip install azure-keyvault-secrets azure-identity")
+                _azure_secrets = azure.keyvault.secrets
+                _azure_identity = azure.identity
+            self._client = _azure_secrets.SecretClient(
+                vault_url=self.vault_url, credential=_azure_identity.DefaultAzureCredential()
+            )
         
         try:
             secret = self._client.get_secret(key)
@@ -68,11 +126,14 @@ class HashiCorpVaultBackend(SecretBackend):
     
     def get_secret(self, key: str) -> str:
         if self._client is None:
-            try:
-                import hvac
-                self._client = hvac.Client(url=self.url, token=self.token)
-            except ImportError:
-                raise ImportError("hvac is required for HashiCorp Vault. Install with: pip install hvac")
+            global _hvac
+            if _hvac is None:
+                try:
+                    import hvac
+                except ImportError:
+                    raise ImportError("hvac is required for HashiCorp Vault. Install with: pip install hvac")
+                _hvac = hvac
+            self._client = _hvac.Client(url=self.url, token=self.token)
         
         try:
             secret = self._client.secrets.kv.v2.read_secret_version(path=key, mount_point=self.mount_point)
@@ -82,10 +143,12 @@ class HashiCorpVaultBackend(SecretBackend):
 
 
 class EnvBackend(SecretBackend):
-    """Fallback to environment variables"""
+    """Fallback to environment variables and loaded env files"""
     
     def get_secret(self, key: str) -> str:
         value = os.getenv(key)
+        if value is None:
+            value = _env_file_values.get(key)
         if value is None:
             raise ValueError(f"Environment variable '{key}' not found")
         return value
@@ -94,6 +157,14 @@ class EnvBackend(SecretBackend):
 # Global registry of backends
 _backend_registry: Dict[str, SecretBackend] = {}
 
+# Built-in backends, instantiated the first time they are requested. Cloud SDKs
+# are only imported once a backend actually fetches a secret.
+_DEFAULTS: Dict[str, Callable[[], SecretBackend]] = {
+    'env': EnvBackend,
+    'aws': lambda: AWSSecretsBackend(region=os.getenv("AWS_DEFAULT_REGION", "us-east-1")),
+    'vault': lambda: HashiCorpVaultBackend(url=os.getenv("VAULT_ADDR", "http://127.0.0.1:8200")),
+}
+
 
 def register_backend(name: str, backend: SecretBackend):
     """Register a custom secret backend"""
@@ -102,10 +173,11 @@ def register_backend(name: str, backend: SecretBackend):
 
 def get_backend(name: str) -> SecretBackend:
     """Get a registered backend by name"""
-    if name not in _backend_registry:
-        raise ValueError(f"Backend '{name}' not registered. Available: {list(_backend_registry.keys())}")
-    return _backend_registry[name]
-
-
-# Register default backends
-register_backend('env', EnvBackend())
+    backend = _backend_registry.get(name)
+    if backend is None:
+        factory = _DEFAULTS.get(name)
+        if factory is None:
+            available = sorted(set(_backend_registry) | set(_DEFAULTS))
+            raise ValueError(f"Backend '{name}' not registered. Available: {available}")
+        backend = _backend_registry.setdefault(name, factory())
+    return backend
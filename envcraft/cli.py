@@ -1,16 +1,19 @@
 import sys
 import argparse
+from functools import lru_cache
 from pathlib import Path
-from importlib import import_module
 
-# Add current directory to path so we can import user's config
-if str(Path.cwd()) not in sys.path:
-    sys.path.insert(0, str(Path.cwd()))
+from . import __version__
 
 
+@lru_cache(maxsize=1)
 def find_config_class():
     """Try to find EnvCraft subclass in common locations"""
-    from envcraft import EnvCraft
+    from importlib import import_module
+    
+    # Add current directory to path so we can import user's config
+    if str(Path.cwd()) not in sys.path:
+        sys.path.insert(0, str(Path.cwd()))
     
     search_paths = [
         "config.AppConfig",
@@ -23,10 +26,13 @@ def find_config_class():
     
     for path in search_paths:
         try:
-            module_name, class_name = path.rsplit(".", 1)
+            module_name, _, class_name = path.rpartition(".")
             module = import_module(module_name)
             config_class = getattr(module, class_name)
             
+            # Only pay for the pydantic import once a candidate module exists
+            from envcraft import EnvCraft
+            
             # Verify it's an EnvCraft subclass
             if issubclass(config_class, EnvCraft):
                 return config_class
@@ -77,61 +83,93 @@ def cmd_explain(args):
         print("❌ Could not find EnvCraft subclass")
         sys.exit(1)
     
-    var_name = args.variable.lower()
+    from .config import _format_annotation
     
-    for field_name, field_info in config_class.model_fields.items():
-        if field_name.lower() == var_name:
-            env_name = field_name.upper()
-            print(f"\n📝 {env_name}\n")
-            
-            if field_info.description:
-                print(f"  Description: {field_info.description}")
-            
-            type_str = str(field_info.annotation).replace('typing.', '').replace('envcraft.config.', '')
-            print(f"  Type: {type_str}")
-            
-            if field_info.is_required():
-                print(f"  Required: Yes")
-            else:
-                print(f"  Required: No")
-                if field_info.default is not None and field_info.default != ...:
-                    print(f"  Default: {field_info.default}")
-            
-            print()
-            return
+    node = config_class._cached_field_info().nodes.get(args.variable.lower())
+    if node is None:
+        print(f"❌ Variable '{args.variable}' not found in config")
+        sys.exit(1)
+    
+    field_info = node.field_info
+    print(f"\n📝 {node.env_name}\n")
     
-    print(f"❌ Variable '{args.variable}' not found in config")
-    sys.exit(1)
+    if field_info.description:
+        print(f"  Description: {field_info.description}")
+    
+    type_str = _format_annotation(field_info.annotation)
+    print(f"  Type: {type_str}")
+    
+    if field_info.is_required():
+        print(f"  Required: Yes")
+    else:
+        print(f"  Required: No")
+        if field_info.default is not None and field_info.default != ...:
+            print(f"  Default: {field_info.default}")
+    
+    print()
+
+
+def _build_check(parser):
+    parser.set_defaults(func=cmd_check)
+
+
+def _build_generate(parser):
+    parser.add_argument("-o", "--output", help="Output file (default: .env.example)")
+    parser.set_defaults(func=cmd_generate)
 
 
-def main():
+def _build_docs(parser):
+    parser.add_argument("-o", "--output", help="Output file (default: CONFIG.md)")
+    parser.set_defaults(func=cmd_docs)
+
+
+def _build_explain(parser):
+    parser.add_argument("variable", help="Variable name to explain")
+    parser.set_defaults(func=cmd_explain)
+
+
+# Subcommand name -> (help text, builder for its arguments)
+_COMMANDS = {
+    "check": ("Validate configuration", _build_check),
+    "generate": ("Generate .env.example", _build_generate),
+    "docs": ("Generate configuration documentation", _build_docs),
+    "explain": ("Explain an environment variable", _build_explain),
+}
+
+
+def _sniff_subcommand(argv):
+    """Return the first non-flag token in argv, or None"""
+    for arg in argv:
+        if not arg.startswith("-"):
+            return arg
+    return None
+
+
+def main(argv=None):
+    if argv is None:
+        argv = sys.argv[1:]
+    
+    # Answer version queries before building any parser
+    if len(argv) == 1 and argv[0] in ("-V", "--version", "version"):
+        print(f"envcraft {__version__}")
+        sys.exit(0)
+    
     parser = argparse.ArgumentParser(
         prog="envcraft",
         description="Environment configuration management tool"
     )
+    parser.add_argument("-V", "--version", action="version", version=f"envcraft {__version__}")
     
     subparsers = parser.add_subparsers(dest="command", help="Available commands")
     
-    # check command
-    parser_check = subparsers.add_parser("check", help="Validate configuration")
-    parser_check.set_defaults(func=cmd_check)
-    
-    # generate command
-    parser_generate = subparsers.add_parser("generate", help="Generate .env.example")
-    parser_generate.add_argument("-o", "--output", help="Output file (default: .env.example)")
-    parser_generate.set_defaults(func=cmd_generate)
-    
-    # docs command
-    parser_docs = subparsers.add_parser("docs", help="Generate configuration documentation")
-    parser_docs.add_argument("-o", "--output", help="Output file (default: CONFIG.md)")
-    parser_docs.set_defaults(func=cmd_docs)
-    
-    # explain command
-    parser_explain = subparsers.add_parser("explain", help="Explain an environment variable")
-    parser_explain.add_argument("variable", help="Variable name to explain")
-    parser_explain.set_defaults(func=cmd_explain)
+    # Register every command name, but only define arguments for the one being run
+    command = _sniff_subcommand(argv)
+    for name, (help_text, build) in _COMMANDS.items():
+        subparser = subparsers.add_parser(name, help=help_text)
+        if name == command:
+            build(subparser)
     
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
     
     if not args.command:
         parser.print_help()
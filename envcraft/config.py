@@ -1,21 +1,187 @@
 from pydantic import BaseModel, Field, ValidationError, field_validator
-from pydantic_settings import BaseSettings, SettingsConfigDict
-from typing import Generic, TypeVar, Any, Dict, Optional, Callable, List
+from pydantic_settings import BaseSettings, EnvSettingsSource, SettingsConfigDict
+try:
+    from pydantic_settings.sources.utils import parse_env_vars
+except ImportError:
+    try:
+        from pydantic_settings.sources import parse_env_vars
+    except ImportError:
+        # pydantic-settings 2.0 has neither env_ignore_empty nor env_parse_none_str
+        parse_env_vars = None
+from typing import Generic, TypeVar, Any, Dict, Optional, Callable, List, NamedTuple, Tuple, FrozenSet, Set, Union, get_origin
+from collections import OrderedDict
+from copy import deepcopy
+from decimal import Decimal
+from enum import Enum
+from functools import lru_cache
 from pathlib import Path
 from threading import RLock
-from difflib import get_close_matches
+from weakref import WeakKeyDictionary, WeakValueDictionary
 import os
 import re
+import sys
+import time
 
 T = TypeVar('T')
 
 # Global registries (outside the class to avoid Pydantic interference)
-_instances: Dict[type, 'EnvConfig'] = {}
-_locks: Dict[type, RLock] = {}
-_reload_callbacks: Dict[type, List[Callable]] = {}
+# Weakly referenced so dynamically created subclasses and unused instances can be collected
+_instances: 'WeakValueDictionary[type, EnvCraft]' = WeakValueDictionary()
+_locks: 'WeakKeyDictionary[type, RLock]' = WeakKeyDictionary()
+_reload_callbacks: 'WeakKeyDictionary[type, List[Callable]]' = WeakKeyDictionary()
+_field_cache: 'WeakKeyDictionary[type, _FieldCache]' = WeakKeyDictionary()
+# Base env file path given to load(env_file=...), reused by later loads and reload()
+_env_paths: 'WeakKeyDictionary[type, Path]' = WeakKeyDictionary()
+# Parsed KEY=value pairs and raw text of the files each class read last, keyed by
+# (device, inode) and tagged with (mtime, size)
+_parsed_files: 'WeakKeyDictionary[type, Dict[Tuple[int, int], Tuple]]' = WeakKeyDictionary()
+# Files modified this recently are never cached, their mtime may not change on the next write
+_RACY_WINDOW_NS = 2_000_000_000
+# Working directories already checked for a .env.example
+_example_checked: Set[str] = set()
+# Rendered .env.example / CONFIG.md bodies
+_example_cache: 'WeakKeyDictionary[type, str]' = WeakKeyDictionary()
+_docs_cache: 'WeakKeyDictionary[type, str]' = WeakKeyDictionary()
+# Recently validated field values keyed by an input fingerprint, most recent last
+_validated_values: 'WeakKeyDictionary[type, OrderedDict]' = WeakKeyDictionary()
+_VALIDATED_CACHE_SIZE = 8
+# Last validated nested model per top-level field, with the inputs it was built from
+_nested_models: 'WeakKeyDictionary[type, Dict[str, Tuple[FrozenSet, BaseModel]]]' = WeakKeyDictionary()
+
+# Match ${VAR} or $VAR
+_INTERP_RE = re.compile(r'\$\{([A-Za-z_][A-Za-z0-9_]*)\}|\$([A-Za-z_][A-Za-z0-9_]*)')
+
+# One KEY=value assignment per line; comments and blank lines don't match
+_ENV_LINE_RE = re.compile(r'(?m)^[ \t]*([A-Za-z_][A-Za-z0-9_]*)[ \t]*=[ \t]*(.*?)[ \t\r]*$')
+
+# Module prefixes stripped from type names in generated docs
+_ANNOTATION_PREFIX_RE = re.compile(r'\b(?:typing|envcraft\.config|envconfig\.config)\.')
+
+
+class _FieldNode(NamedTuple):
+    """A config field with its env name; children is set for nested BaseModels"""
+    env_name: str
+    path: Tuple[str, ...]   # field names from the top-level model down to this field
+    field_info: Any
+    children: Optional[Tuple['_FieldNode', ...]]
+
+
+class _FieldCache(NamedTuple):
+    """Per-class field metadata derived from model_fields"""
+    env_names: FrozenSet[str]    # uppercase env names of leaf fields
+    known_keys: FrozenSet[str]   # lowercase env names of all fields, nested parents included
+    tree: Tuple[_FieldNode, ...]
+    # lowercase env name -> field node, nested parents included
+    nodes: Dict[str, _FieldNode]
+    # lowercase env name -> field path, for plain scalar fields that need no JSON decoding
+    flatmap: Dict[str, Tuple[str, ...]]
+    # pydantic-settings reads no env names beyond known_keys, so they fingerprint its inputs
+    plain_env: bool
+
+
+@lru_cache(maxsize=256)
+def _format_annotation_cached(annotation) -> str:
+    return _ANNOTATION_PREFIX_RE.sub('', str(annotation))
+
+
+def _format_annotation(annotation) -> str:
+    """Render a field annotation as a readable type name"""
+    try:
+        return _format_annotation_cached(annotation)
+    except TypeError:
+        # Unhashable annotation, format without caching
+        return _ANNOTATION_PREFIX_RE.sub('', str(annotation))
+
+
+def _walk_fields(fields, prefix: str = "", parent: Tuple[str, ...] = ()) -> Tuple[_FieldNode, ...]:
+    """Build a field tree, recursing into nested BaseModel fields"""
+    nodes = []
+    for field_name, field_info in fields.items():
+        env_name = sys.intern(f"{prefix}{field_name.upper()}")
+        path = parent + (field_name,)
+        field_type = field_info.annotation
+        children = None
+        try:
+            if isinstance(field_type, type) and issubclass(field_type, BaseModel):
+                children = _walk_fields(field_type.model_fields, f"{env_name}__", path)
+        except TypeError:
+            pass
+        nodes.append(_FieldNode(env_name, path, field_info, children))
+    return tuple(nodes)
+
+
+# Field types pydantic-settings passes through as plain strings, never JSON-decoded
+_PLAIN_SCALAR_TYPES = (str, int, float, Decimal, Path, Enum)
+
+
+def _is_plain_scalar(field_info) -> bool:
+    """Whether a field takes a string value as-is, without JSON decoding"""
+    annotation = field_info.annotation
+    if get_origin(annotation) is Secret:
+        return True
+    return isinstance(annotation, type) and issubclass(annotation, _PLAIN_SCALAR_TYPES + (Secret,))
+
+
+def _reads_only_known_keys(settings_cls, nodes) -> bool:
+    """Whether env and dotenv sources only look up the default field env names"""
+    # Custom sources can read anything
+    customise = getattr(settings_cls.settings_customise_sources, '__func__', None)
+    if customise is not BaseSettings.settings_customise_sources.__func__:
+        return False
+    config = settings_cls.model_config
+    if config.get('env_prefix') or config.get('case_sensitive') or config.get('secrets_dir'):
+        return False
+    if config.get('env_nested_delimiter') != '__' or config.get('env_file') not in ('.env', None):
+        return False
+    return all(
+        n.field_info.alias is None and n.field_info.validation_alias is None for n in nodes
+    )
+
+
+def _read_env_file(path: str, previous: Dict, current: Dict) -> Optional[Tuple[List[Tuple[str, str]], str]]:
+    """Parse an env file into (key, raw value) pairs and its text, reusing the previous parse if unchanged"""
+    try:
+        st = os.stat(path)
+        file_id = (st.st_dev, st.st_ino)
+        stamp = (st.st_mtime_ns, st.st_size)
+        cached = previous.get(file_id)
+        if cached is not None and cached[0] == stamp:
+            current[file_id] = cached
+            return cached[1], cached[2]
+        with open(path, encoding='utf-8') as f:
+            content = f.read()
+    except FileNotFoundError:
+        return None
+    
+    pairs = _ENV_LINE_RE.findall(content)
+    # Like git's racy-clean check: a file written within the timestamp granularity
+    # could be rewritten without its mtime moving, so only cache settled files
+    if st.st_mtime_ns < time.time_ns() - _RACY_WINDOW_NS:
+        current[file_id] = (stamp, pairs, content)
+    return pairs, content
+
+
+def _deep_update(base: Dict[str, Any], updates: Dict[str, Any]) -> Dict[str, Any]:
+    """Recursively merge updates into base, updates winning on conflicts"""
+    for key, value in updates.items():
+        if isinstance(value, dict) and isinstance(base.get(key), dict):
+            _deep_update(base[key], value)
+        else:
+            base[key] = value
+    return base
+
+
+def _iter_nodes(nodes):
+    for node in nodes:
+        yield node
+        if node.children is not None:
+            yield from _iter_nodes(node.children)
+
 
 class Secret(Generic[T]):
     """Wrapper for secret values that won't be logged or printed"""
+    __slots__ = ('_value', '_backend', '_key')
+    
     def __init__(self, value: T, backend: Optional[str] = None, key: Optional[str] = None):
         if backend and key:
             # Lazy load from backend
@@ -104,6 +270,31 @@ class Secret(Generic[T]):
         return cls(None, backend=backend_name, key=key)
 
 
+class _ParsedEnvSource(EnvSettingsSource):
+    """Settings source that reads variables parsed from .env files instead of os.environ"""
+    
+    def __init__(self, settings_cls, env_vars: Dict[str, str]):
+        self._parsed_vars = env_vars
+        # Passed explicitly, older pydantic-settings only read these from the arguments
+        config = settings_cls.model_config
+        super().__init__(
+            settings_cls,
+            case_sensitive=config.get('case_sensitive'),
+            env_prefix=config.get('env_prefix'),
+            env_nested_delimiter=config.get('env_nested_delimiter'),
+        )
+    
+    def _load_env_vars(self):
+        # Same key and value handling pydantic-settings applies to os.environ
+        if parse_env_vars is not None:
+            return parse_env_vars(
+                self._parsed_vars, self.case_sensitive, self.env_ignore_empty, self.env_parse_none_str
+            )
+        if self.case_sensitive:
+            return self._parsed_vars
+        return {key.lower(): value for key, value in self._parsed_vars.items()}
+
+
 class EnvCraft(BaseSettings):
     """Enhanced environment configuration with better errors and multi-source loading"""
     
@@ -124,46 +315,152 @@ class EnvCraft(BaseSettings):
     @classmethod
     def _get_lock(cls) -> RLock:
         """Get or create lock for this class"""
-        if cls not in _locks:
-            _locks[cls] = RLock()
-        return _locks[cls]
+        lock = _locks.get(cls)
+        if lock is None:
+            # setdefault is atomic, so concurrent callers always share one lock
+            lock = _locks.setdefault(cls, RLock())
+        return lock
     
     @classmethod
     def _get_callbacks(cls) -> List[Callable]:
         """Get or create callback list for this class"""
-        if cls not in _reload_callbacks:
-            _reload_callbacks[cls] = []
-        return _reload_callbacks[cls]
+        return _reload_callbacks.setdefault(cls, [])
+    
+    @classmethod
+    def _cached_field_info(cls) -> _FieldCache:
+        """Get or build the field metadata for this class"""
+        info = _field_cache.get(cls)
+        if info is None:
+            tree = _walk_fields(cls.model_fields)
+            nodes = list(_iter_nodes(tree))
+            # Interned so lookups with the same key objects short-circuit on identity
+            by_name = {sys.intern(n.env_name.lower()): n for n in nodes}
+            plain_env = _reads_only_known_keys(cls, nodes)
+            config = cls.model_config
+            # Values go into init kwargs untouched, so no source-side value handling may apply
+            use_flatmap = plain_env and not (
+                config.get('env_ignore_empty')
+                or config.get('env_parse_none_str') is not None
+                or config.get('env_parse_enums')
+            )
+            info = _FieldCache(
+                env_names=frozenset(n.env_name for n in nodes if n.children is None),
+                known_keys=frozenset(by_name),
+                tree=tree,
+                nodes=by_name,
+                # Without a prefix or aliases, env names map straight to field paths
+                flatmap={
+                    name: n.path
+                    for name, n in by_name.items()
+                    if n.children is None and _is_plain_scalar(n.field_info)
+                } if use_flatmap else {},
+                plain_env=plain_env,
+            )
+            _field_cache[cls] = info
+        return info
+    
+    @classmethod
+    def _build_init_values(cls, env_vars: Dict[str, str]) -> Dict[str, Any]:
+        """Turn parsed KEY=value pairs into (possibly nested) init kwargs"""
+        flatmap = cls._cached_field_info().flatmap
+        values: Dict[str, Any] = {}
+        remaining = {}
+        
+        for key, value in env_vars.items():
+            path = flatmap.get(key)
+            if path is None:
+                remaining[key] = value
+                continue
+            target = values
+            for name in path[:-1]:
+                target = target.setdefault(name, {})
+            target[path[-1]] = value
+        
+        # Complex, aliased or unknown names go through the settings source, which
+        # handles JSON decoding and alias resolution like the process env source
+        if remaining:
+            values = _deep_update(_ParsedEnvSource(cls, remaining)(), values)
+        return values
+    
+    @classmethod
+    def _nested_inputs(cls, items: FrozenSet[Tuple[str, str]]) -> Dict[str, FrozenSet[Tuple[str, str]]]:
+        """Split (name, value) inputs by the top-level nested model field they feed"""
+        inputs = {}
+        for node in cls._cached_field_info().tree:
+            if node.children is None:
+                continue
+            name = node.env_name.lower()
+            prefix = f"{name}__"
+            inputs[node.path[0]] = frozenset(
+                item for item in items if item[0] == name or item[0].startswith(prefix)
+            )
+        return inputs
     
     @classmethod
     def _interpolate_variables(cls, content: str, env_vars: Dict[str, str]) -> str:
         """Interpolate ${VAR} syntax in environment file content"""
-        def replace_var(match):
-            var_name = match.group(1)
-            # Check in current env_vars first, then os.environ
-            return env_vars.get(var_name, os.environ.get(var_name, match.group(0)))
-        
-        # Match ${VAR} or $VAR
-        pattern = r'\$\{([A-Za-z_][A-Za-z0-9_]*)\}|\$([A-Za-z_][A-Za-z0-9_]*)'
+        # Most values don't reference other variables; skip the regex entirely
+        if '$' not in content:
+            return content
         
         def replacer(match):
             var_name = match.group(1) or match.group(2)
-            return env_vars.get(var_name, os.environ.get(var_name, match.group(0)))
+            # Check in current env_vars first, only falling back to os.environ on a miss
+            value = env_vars.get(var_name)
+            if value is None:
+                value = os.environ.get(var_name, match.group(0))
+            return value
         
-        return re.sub(pattern, replacer, content)
+        return _INTERP_RE.sub(replacer, content)
     
     @classmethod
-    def load(cls, env: str = None, auto_generate_example: bool = True, show_sources: bool = False, strict: bool = False, cache: bool = True):
+    def load(cls, env: str = None, auto_generate_example: bool = True, show_sources: bool = False, strict: bool = False, cache: bool = True, env_file: Optional[Union[str, Path]] = None):
         """Load config with environment-specific overrides"""
+        # A custom base file (default: ./.env) is resolved once and remembered for
+        # later loads and reload() until reset_env_file(); its .{env} and .local
+        # variants sit next to it
+        if env_file is not None:
+            path = Path(env_file).resolve()
+            with cls._get_lock():
+                if _env_paths.get(cls) != path:
+                    _env_paths[cls] = path
+                    # The cached instance was read from another file
+                    _instances.pop(cls, None)
+        
         # Return cached instance if available
-        if cache and cls in _instances:
-            return _instances[cls]
+        if cache:
+            instance = _instances.get(cls)
+            if instance is not None:
+                return instance
         
         lock = cls._get_lock()
         with lock:
+            # Another thread may have finished loading while we waited for the lock
+            if cache:
+                instance = _instances.get(cls)
+                if instance is not None:
+                    return instance
+            
             # Auto-generate .env.example if it doesn't exist
-            if auto_generate_example and not Path('.env.example').exists():
-                cls.generate_example()
+            # Only checked once per working directory, .env.example rarely disappears mid-process
+            if auto_generate_example:
+                cwd = os.getcwd()
+                if cwd not in _example_checked:
+                    _example_checked.add(cwd)
+                    if not Path('.env.example').exists():
+                        cls.generate_example()
+            
+            all_vars, source_map, interp_vars, base_path, texts = cls._parse_env_files(env)
+            # Let Secret.from_backend('env') see file values, load() no longer writes os.environ
+            from .backends import _env_file_values
+            _env_file_values.update(interp_vars)
+            
+            # In strict mode, check for unknown variables
+            if strict:
+                # Set difference against the cached frozenset of known (nested) names
+                unknown_vars = all_vars.keys() - cls._cached_field_info().known_keys
+                if unknown_vars:
+                    cls._raise_unknown_vars(unknown_vars)
             
             # Apply strict mode if requested
             if strict:
@@ -173,53 +470,69 @@ class EnvCraft(BaseSettings):
             else:
                 original_extra = None
             
-            env_files = ['.env']
-            if env:
-                env_files.append(f'.env.{env}')
-            env_files.append('.env.local')
-            
-            # Track which file provides each variable and load with interpolation
-            source_map = {}
-            all_vars = {}
+            # Everything validation depends on: parsed files plus relevant process env
+            known_keys = cls._cached_field_info().known_keys
+            file_items = frozenset(all_vars.items())
+            # Filter on names first so only matching values are decoded from os.environ
+            env_items = frozenset(
+                (k.lower(), os.environ[k]) for k in list(os.environ) if k.lower() in known_keys
+            )
+            if cls._cached_field_info().plain_env:
+                fingerprint = (strict, base_path, texts, file_items, env_items)
+            else:
+                # Prefixes, aliases or extra sources read names the fingerprint can't see
+                fingerprint = None
+            seen = _validated_values.setdefault(cls, OrderedDict())
             
-            for env_file in env_files:
-                if Path(env_file).exists():
-                    with open(env_file) as f:
-                        content = f.read()
-                    
-                    # Parse variables first
-                    temp_vars = {}
-                    for line in content.split('\n'):
-                        line = line.strip()
-                        if line and not line.startswith('#') and '=' in line:
-                            key, value = line.split('=', 1)
-                            key = key.strip()
-                            temp_vars[key] = value.strip()
+            try:
+                cached = seen.get(fingerprint) if fingerprint is not None else None
+                if cached is not None:
+                    # Same inputs as an earlier successful load, skip re-validation.
+                    # Copied so instances never share mutable values
+                    seen.move_to_end(fingerprint)
+                    values, extra, fields_set = cached
+                    instance = cls.model_construct(_fields_set=set(fields_set), **deepcopy(values))
+                    if extra is not None:
+                        instance.__pydantic_extra__ = deepcopy(extra)
+                else:
+                    # Pass parsed values as init kwargs rather than writing them to os.environ.
+                    # Case-sensitive configs need the names as spelled in the files
+                    if cls.model_config.get('case_sensitive'):
+                        init_values = cls._build_init_values(interp_vars)
+                    else:
+                        init_values = cls._build_init_values(all_vars)
                     
-                    # Interpolate variables
-                    interpolated_content = cls._interpolate_variables(content, {**all_vars, **temp_vars})
+                    # Reuse nested models whose own inputs haven't changed; pydantic
+                    # accepts an existing instance without re-validating it. Copies,
+                    # so configs never share a nested model
+                    if fingerprint is not None:
+                        nested_inputs = cls._nested_inputs(file_items | env_items)
+                    else:
+                        nested_inputs = {}
+                    previous = _nested_models.get(cls, {})
+                    for field_name, inputs in nested_inputs.items():
+                        prev = previous.get(field_name)
+                        if prev is not None and prev[0] == inputs:
+                            init_values[field_name] = prev[1].model_copy(deep=True)
                     
-                    # Parse again with interpolated values
-                    for line in interpolated_content.split('\n'):
-                        line = line.strip()
-                        if line and not line.startswith('#') and '=' in line:
-                            key, value = line.split('=', 1)
-                            key = key.strip().lower()
-                            all_vars[key] = value.strip()
-                            source_map[key] = env_file
-                            # Set in environment for Pydantic to pick up
-                            os.environ[key.upper()] = value.strip()
-            
-            # In strict mode, check for unknown variables
-            if strict:
-                known_fields = {name.lower() for name in cls.model_fields.keys()}
-                unknown_vars = set(all_vars.keys()) - known_fields
-                if unknown_vars:
-                    unknown_list = ', '.join(sorted(unknown_vars))
-                    raise ValueError(f"Unknown environment variables in strict mode: {unknown_list}")
-            
-            try:
-                instance = cls()
+                    if base_path is not None:
+                        # Don't let pydantic-settings also read .env from the working directory
+                        init_values['_env_file'] = None
+                    instance = cls(**init_values)
+                    _nested_models[cls] = {
+                        field_name: (inputs, getattr(instance, field_name).model_copy(deep=True))
+                        for field_name, inputs in nested_inputs.items()
+                    }
+                    if fingerprint is not None:
+                        # Declared fields only, __dict__ also holds private attributes
+                        values = {name: instance.__dict__[name] for name in cls.model_fields}
+                        seen[fingerprint] = (
+                            deepcopy(values),
+                            deepcopy(instance.__pydantic_extra__),
+                            set(instance.model_fields_set),
+                        )
+                        if len(seen) > _VALIDATED_CACHE_SIZE:
+                            seen.popitem(last=False)
                 instance._source_map = source_map
                 
                 if cache:
@@ -237,13 +550,93 @@ class EnvCraft(BaseSettings):
                 if original_extra is not None:
                     cls.model_config['extra'] = original_extra
     
+    @classmethod
+    def _parse_env_files(cls, env: Optional[str] = None):
+        """Read and interpolate the env files load() would use, without validating"""
+        base_path = _env_paths.get(cls)
+        if base_path is None:
+            directory, base_name = '.', '.env'
+        else:
+            directory, base_name = str(base_path.parent), base_path.name
+        
+        env_files = [base_name]
+        if env:
+            env_files.append(f'{base_name}.{env}')
+        env_files.append(f'{base_name}.local')
+        
+        # Track which file provides each variable and load with interpolation
+        source_map = {}
+        all_vars = {}
+        # Interpolated values keyed by their original spelling, for ${VAR} lookups
+        interp_vars = {}
+        # Raw file contents; pydantic-settings' own dotenv parse of ./.env also sees
+        # lines the KEY=value pattern skips, such as `export KEY=value`
+        texts = []
+        
+        # One directory read instead of probing each candidate file
+        try:
+            with os.scandir(directory) as entries:
+                present = {entry.name for entry in entries if entry.is_file()}
+        except (FileNotFoundError, NotADirectoryError):
+            present = set()
+        
+        # Only the files read this time stay cached, so the cache can't grow unbounded
+        previous = _parsed_files.get(cls, {})
+        parsed = {}
+        
+        for name in env_files:
+            if name not in present:
+                continue
+            path = name if base_path is None else os.path.join(directory, name)
+            result = _read_env_file(path, previous, parsed)
+            if result is None:
+                continue
+            pairs, text = result
+            texts.append(text)
+            
+            # Earlier files contribute interpolated values; this file's own
+            # raw values are visible too, so forward references still resolve
+            lookup = {**interp_vars, **dict(pairs)}
+            for key, value in pairs:
+                value = cls._interpolate_variables(value, lookup)
+                interp_vars[key] = value
+                key = key.lower()
+                all_vars[key] = value
+                source_map[key] = path
+        
+        _parsed_files[cls] = parsed
+        return all_vars, source_map, interp_vars, base_path, tuple(texts)
+    
+    @classmethod
+    def _raise_unknown_vars(cls, unknown_vars):
+        """Raise the strict-mode error, with close field names attached as notes"""
+        from difflib import get_close_matches
+        
+        unknown_list = ', '.join(sorted(unknown_vars))
+        error = ValueError(f"Unknown environment variables in strict mode: {unknown_list}")
+        
+        valid_fields = cls._cached_field_info().env_names
+        for name in sorted(unknown_vars):
+            suggestions = get_close_matches(name.upper(), valid_fields, n=3, cutoff=0.6)
+            if suggestions:
+                note = f"{name.upper()}: did you mean {', '.join(suggestions)}?"
+                if hasattr(error, 'add_note'):
+                    error.add_note(note)
+                else:
+                    # No exception notes before Python 3.11, keep the hint in the message
+                    error.args = (f"{error.args[0]}\n{note}",)
+        raise error
+    
     @classmethod
     def reload(cls):
         """Reload configuration from files"""
         lock = cls._get_lock()
         with lock:
-            if cls in _instances:
-                del _instances[cls]
+            _instances.pop(cls, None)
+            _example_checked.discard(os.getcwd())
+            _field_cache.pop(cls, None)
+            _example_cache.pop(cls, None)
+            _docs_cache.pop(cls, None)
             new_instance = cls.load(cache=True)
             
             # Trigger reload callbacks
@@ -252,17 +645,50 @@ class EnvCraft(BaseSettings):
             
             return new_instance
     
+    @classmethod
+    def reset_env_file(cls):
+        """Forget the env_file given to load(), going back to ./.env"""
+        with cls._get_lock():
+            if _env_paths.pop(cls, None) is not None:
+                _instances.pop(cls, None)
+    
     @classmethod
     def on_reload(cls, callback: Callable[['EnvConfig'], None]):
         """Register a callback to be called when config is reloaded"""
+        # Checked once here so reload() can call every callback without guards
+        if not callable(callback):
+            raise TypeError(f"Reload callback must be callable, got {type(callback).__name__}")
         cls._get_callbacks().append(callback)
     
+    def fetch_secrets(self):
+        """Resolve all backend secrets now, with one batched request per backend"""
+        from .backends import get_backend
+        
+        pending: Dict[str, List[Secret]] = {}
+        for node in _iter_nodes(type(self)._cached_field_info().tree):
+            if node.children is not None:
+                continue
+            # Follow the path down through nested models
+            value = self
+            for field_name in node.path:
+                value = getattr(value, field_name, None)
+            if isinstance(value, Secret) and value._value is None and value._backend and value._key:
+                pending.setdefault(value._backend, []).append(value)
+        
+        for backend_name, secrets in pending.items():
+            keys = list(dict.fromkeys(secret._key for secret in secrets))
+            values = get_backend(backend_name).get_secrets(keys)
+            for secret in secrets:
+                secret._value = values[secret._key]
+    
     @classmethod
     def _print_sources(cls, instance, source_map: Dict[str, str]):
         """Print which file supplied each variable"""
         print("\n📋 Environment Variable Sources:\n")
-        for field_name in cls.model_fields.keys():
-            env_name = field_name.lower()
+        for env_name, node in cls._cached_field_info().nodes.items():
+            if len(node.path) > 1:
+                continue
+            field_name = node.path[0]
             source = source_map.get(env_name, "default value")
             value = getattr(instance, field_name)
             
@@ -272,7 +698,7 @@ class EnvCraft(BaseSettings):
             else:
                 display_value = value
             
-            print(f"  {field_name.upper()} = {display_value}")
+            print(f"  {node.env_name} = {display_value}")
             print(f"    └─ loaded from {source}")
         print()
     
@@ -282,29 +708,29 @@ class EnvCraft(BaseSettings):
         print("\n🔍 Configuration Diagnosis:\n")
         
         all_valid = True
-        env_vars = {k.lower(): v for k, v in os.environ.items()}
+        # Only membership is checked, so keep the names and not the values
+        env_keys = {k.lower() for k in os.environ}
+        # Values from the env files count too, load() passes them to the model directly
+        env_keys.update(cls._parse_env_files()[0])
         
-        def check_fields(fields, prefix=""):
+        def check_fields(nodes):
             nonlocal all_valid
             
-            for field_name, field_info in fields.items():
-                field_type = field_info.annotation
+            for node in nodes:
+                field_info = node.field_info
+                env_name = node.env_name
                 
                 # Check if nested BaseModel
-                try:
-                    if isinstance(field_type, type) and issubclass(field_type, BaseModel):
-                        print(f"  {prefix}{field_name.upper()} (nested):")
-                        check_fields(field_type.model_fields, f"{prefix}{field_name.upper()}__")
-                        continue
-                except TypeError:
-                    pass
+                if node.children is not None:
+                    print(f"  {env_name} (nested):")
+                    check_fields(node.children)
+                    continue
                 
-                env_name = f"{prefix}{field_name.upper()}"
                 env_name_lower = env_name.lower()
                 
                 # Check if variable is present
-                has_value = env_name_lower in env_vars
-                has_default = field_info.default is not None and field_info.default != ...
+                has_value = env_name_lower in env_keys
+                has_default = not field_info.is_required() and field_info.default is not None
                 is_required = field_info.is_required()
                 
                 if has_value:
@@ -317,7 +743,7 @@ class EnvCraft(BaseSettings):
                 else:
                     print(f"  ⚠ {env_name} not set (optional)")
         
-        check_fields(cls.model_fields)
+        check_fields(cls._cached_field_info().tree)
         
         print()
         
@@ -331,29 +757,36 @@ class EnvCraft(BaseSettings):
     @classmethod
     def generate_docs(cls, output_file: str = 'CONFIG.md'):
         """Generate Markdown documentation from config schema"""
+        content = _docs_cache.get(cls)
+        if content is None:
+            content = cls._render_docs()
+            _docs_cache[cls] = content
+        
+        Path(output_file).write_text(content)
+        print(f"✓ Generated {output_file}")
+    
+    @classmethod
+    def _render_docs(cls) -> str:
         lines = [
             "# Configuration Documentation\n",
             "This document describes all available configuration options.\n",
         ]
         
-        def add_field_docs(fields, prefix="", level=2):
-            for field_name, field_info in fields.items():
-                field_type = field_info.annotation
+        def add_field_docs(nodes, level=2):
+            for node in nodes:
+                field_info = node.field_info
+                env_name = node.env_name
                 
                 # Check if nested BaseModel
-                try:
-                    if isinstance(field_type, type) and issubclass(field_type, BaseModel):
-                        lines.append(f"{'#' * level} {prefix}{field_name.upper()}\n")
-                        if field_info.description:
-                            lines.append(f"{field_info.description}\n")
-                        lines.append("")
-                        add_field_docs(field_type.model_fields, f"{prefix}{field_name.upper()}__", level + 1)
-                        continue
-                except TypeError:
-                    pass
+                if node.children is not None:
+                    lines.append(f"{'#' * level} {env_name}\n")
+                    if field_info.description:
+                        lines.append(f"{field_info.description}\n")
+                    lines.append("")
+                    add_field_docs(node.children, level + 1)
+                    continue
                 
-                env_name = f"{prefix}{field_name.upper()}"
-                type_str = str(field_type).replace('typing.', '').replace('envconfig.config.', '')
+                type_str = _format_annotation(field_info.annotation)
                 
                 lines.append(f"{'#' * level} {env_name}\n")
                 
@@ -375,31 +808,28 @@ class EnvCraft(BaseSettings):
                     lines.append(f"{env_name}=<value>")
                 lines.append("```\n")
         
-        add_field_docs(cls.model_fields)
+        add_field_docs(cls._cached_field_info().tree)
         
-        Path(output_file).write_text('\n'.join(lines))
-        print(f"✓ Generated {output_file}")
+        return '\n'.join(lines)
     
     @classmethod
     def _format_error(cls, error: ValidationError):
         """Format validation errors with helpful messages and smart suggestions"""
         print("\n❌ Environment Configuration Error:\n")
         
-        # Get all valid field names for suggestions
-        valid_fields = set()
+        # Valid field names for suggestions, only gathered if an error needs them
+        valid_fields = None
         
-        def collect_fields(fields, prefix=""):
-            for field_name in fields.keys():
-                field_type = fields[field_name].annotation
-                try:
-                    if isinstance(field_type, type) and issubclass(field_type, BaseModel):
-                        collect_fields(field_type.model_fields, f"{prefix}{field_name.upper()}__")
-                    else:
-                        valid_fields.add(f"{prefix}{field_name.upper()}")
-                except TypeError:
-                    valid_fields.add(f"{prefix}{field_name.upper()}")
-        
-        collect_fields(cls.model_fields)
+        def print_suggestions(name):
+            nonlocal valid_fields
+            # Only needed on the error path, so keep it out of module import time
+            from difflib import get_close_matches
+            
+            if valid_fields is None:
+                valid_fields = cls._cached_field_info().env_names
+            suggestions = get_close_matches(name, valid_fields, n=3, cutoff=0.6)
+            if suggestions:
+                print(f"    💡 Did you mean: {', '.join(suggestions)}?")
         
         for err in error.errors():
             field = err['loc'][0]
@@ -413,9 +843,7 @@ class EnvCraft(BaseSettings):
                 print(f"    → Set {field.upper()} in your .env file or environment")
                 
                 # Smart suggestions
-                suggestions = get_close_matches(field.upper(), valid_fields, n=3, cutoff=0.6)
-                if suggestions:
-                    print(f"    💡 Did you mean: {', '.join(suggestions)}?")
+                print_suggestions(field.upper())
             elif 'int' in error_type:
                 print(f"    → {field.upper()} must be a valid integer")
             elif 'bool' in error_type:
@@ -423,42 +851,46 @@ class EnvCraft(BaseSettings):
             elif 'extra' in error_type:
                 # Unknown field in strict mode
                 print(f"    → {field.upper()} is not a valid configuration variable")
-                suggestions = get_close_matches(field.upper(), valid_fields, n=3, cutoff=0.6)
-                if suggestions:
-                    print(f"    💡 Did you mean: {', '.join(suggestions)}?")
+                print_suggestions(field.upper())
             print()
     
     @classmethod
     def generate_example(cls, output_file: str = '.env.example'):
         """Generate .env.example from config schema"""
+        content = _example_cache.get(cls)
+        if content is None:
+            content = cls._render_example()
+            _example_cache[cls] = content
+        
+        Path(output_file).write_text(content)
+        print(f"✓ Generated {output_file}")
+    
+    @classmethod
+    def _render_example(cls) -> str:
         lines = ["# Environment Configuration Template\n"]
         
-        def add_fields(fields, prefix=""):
-            for field_name, field_info in fields.items():
-                field_type = field_info.annotation
+        def add_fields(nodes):
+            for node in nodes:
+                field_info = node.field_info
                 description = field_info.description
+                env_name = node.env_name
                 
                 # Check if this is a nested BaseModel
-                try:
-                    if isinstance(field_type, type) and issubclass(field_type, BaseModel):
-                        # Nested config
-                        lines.append(f"# {prefix}{field_name.upper()} (nested)")
-                        if description:
-                            lines.append(f"# {description}")
-                        lines.append("")
-                        add_fields(field_type.model_fields, f"{prefix}{field_name.upper()}__")
-                        continue
-                except TypeError:
-                    pass
-                
-                env_name = f"{prefix}{field_name.upper()}"
+                if node.children is not None:
+                    # Nested config
+                    lines.append(f"# {env_name} (nested)")
+                    if description:
+                        lines.append(f"# {description}")
+                    lines.append("")
+                    add_fields(node.children)
+                    continue
                 
                 # Add description if available
                 if description:
                     lines.append(f"# {description}")
                 
                 # Add comment with type
-                type_str = str(field_type).replace('typing.', '').replace('envconfig.config.', '')
+                type_str = _format_annotation(field_info.annotation)
                 lines.append(f"# Type: {type_str}")
                 
                 # Add default if exists
@@ -468,10 +900,9 @@ class EnvCraft(BaseSettings):
                     lines.append(f"{env_name}=")
                 lines.append("")
         
-        add_fields(cls.model_fields)
+        add_fields(cls._cached_field_info().tree)
         
-        Path(output_file).write_text('\n'.join(lines))
-        print(f"✓ Generated {output_file}")
+        return '\n'.join(lines)
 
 
 # Example usage
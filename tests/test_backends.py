@@ -59,6 +59,21 @@ def test_env_backend():
     del os.environ["TEST_SECRET"]
 
 
+def test_env_backend_sees_env_file_values(tmp_path, monkeypatch):
+    """Values from .env are visible to the env backend without touching os.environ"""
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.delenv("ENV_FILE_SECRET", raising=False)
+    
+    class EnvFileSecretConfig(EnvCraft):
+        env_file_secret: str = "default"
+    
+    (tmp_path / ".env").write_text("ENV_FILE_SECRET=from_file")
+    EnvFileSecretConfig.load(cache=False, auto_generate_example=False)
+    
+    assert "ENV_FILE_SECRET" not in os.environ
+    assert Secret.from_backend("ENV_FILE_SECRET", backend="env").get() == "from_file"
+
+
 def test_secret_in_config(tmp_path, monkeypatch):
     """Test Secret fields in EnvCraft config"""
     monkeypatch.chdir(tmp_path)
@@ -159,3 +174,198 @@ SECRET3=value3
     assert config.secret1 == "value1"
     assert config.secret2 == "value2"
     assert config.secret3 == "value3"
+
+
+def test_default_cloud_backend_is_lazy(monkeypatch):
+    """Test that built-in cloud backends are created without importing their SDK"""
+    from envcraft import backends
+    from envcraft.backends import AWSSecretsBackend
+    
+    # Empty registry for this test only, restored afterwards
+    monkeypatch.setattr(backends, "_backend_registry", {})
+    monkeypatch.setenv("AWS_DEFAULT_REGION", "eu-west-1")
+    
+    backend = get_backend("aws")
+    assert isinstance(backend, AWSSecretsBackend)
+    assert backend.region == "eu-west-1"
+    assert backend._client is None
+    assert get_backend("aws") is backend
+
+
+def test_fetch_secrets_batches_per_backend(tmp_path, monkeypatch):
+    """Test that fetch_secrets resolves all pending secrets in one call per backend"""
+    monkeypatch.chdir(tmp_path)
+    
+    calls = []
+    
+    class BatchBackend(SecretBackend):
+        def get_secret(self, key: str) -> str:
+            raise AssertionError("should be fetched in a batch")
+        
+        def get_secrets(self, keys):
+            calls.append(keys)
+            return {key: f"batch_{key}" for key in keys}
+    
+    register_backend("batch", BatchBackend())
+    
+    class BatchConfig(EnvCraft):
+        first: Secret[str] = Secret.from_backend("first", backend="batch")
+        second: Secret[str] = Secret.from_backend("second", backend="batch")
+    
+    config = BatchConfig.load(cache=False, auto_generate_example=False)
+    config.fetch_secrets()
+    
+    assert calls == [["first", "second"]]
+    assert config.first.get() == "batch_first"
+    assert config.second.get() == "batch_second"
+
+
+def test_fetch_secrets_includes_nested_models(tmp_path, monkeypatch):
+    """Test that fetch_secrets also resolves secrets inside nested models"""
+    from pydantic import BaseModel
+    
+    monkeypatch.chdir(tmp_path)
+    
+    calls = []
+    
+    class NestedBatchBackend(SecretBackend):
+        def get_secret(self, key: str) -> str:
+            raise AssertionError("should be fetched in a batch")
+        
+        def get_secrets(self, keys):
+            calls.append(keys)
+            return {key: f"batch_{key}" for key in keys}
+    
+    register_backend("nested_batch", NestedBatchBackend())
+    
+    class DBSecrets(BaseModel):
+        password: Secret[str] = Secret.from_backend("db_password", backend="nested_batch")
+    
+    class NestedSecretConfig(EnvCraft):
+        api_key: Secret[str] = Secret.from_backend("api_key", backend="nested_batch")
+        db: DBSecrets = DBSecrets()
+    
+    config = NestedSecretConfig.load(cache=False, auto_generate_example=False)
+    config.fetch_secrets()
+    
+    assert calls == [["api_key", "db_password"]]
+    assert config.db.password.get() == "batch_db_password"
+
+
+ARN_PREFIX = "arn:aws:secretsmanager:us-east-1:123456789012:secret:"
+
+
+class FakeSecretsManagerClient:
+    """Minimal stand-in for the boto3 secretsmanager client"""
+    
+    def __init__(self, page_size=None, errors=None):
+        self.page_size = page_size
+        self.errors = errors or []
+        self.batch_calls = []
+        self.single_calls = []
+    
+    def batch_get_secret_value(self, SecretIdList, NextToken=None):
+        self.batch_calls.append((list(SecretIdList), NextToken))
+        # ARNs resolve to the secret name, like the real API
+        names = [key.rsplit(":", 1)[-1].split("-")[0] for key in SecretIdList]
+        start = int(NextToken or 0)
+        end = len(names) if self.page_size is None else start + self.page_size
+        response = {
+            'SecretValues': [
+                {'Name': name, 'ARN': f"{ARN_PREFIX}{name}-AbCdEf", 'SecretString': f"value_{name}"}
+                for name in names[start:end]
+            ],
+            'Errors': self.errors if start == 0 else [],
+        }
+        if end < len(names):
+            response['NextToken'] = str(end)
+        return response
+    
+    def get_secret_value(self, SecretId):
+        self.single_calls.append(SecretId)
+        return {'SecretString': f"value_{SecretId}"}
+
+
+def test_aws_get_secrets_chunks_and_pages():
+    """Test that AWS batches go 20 ids per request and follow NextToken"""
+    from envcraft.backends import AWSSecretsBackend
+    
+    backend = AWSSecretsBackend()
+    backend._client = FakeSecretsManagerClient(page_size=15)
+    keys = [f"secret{i}" for i in range(25)]
+    
+    values = backend.get_secrets(keys)
+    
+    assert values == {key: f"value_{key}" for key in keys}
+    assert [(len(ids), token) for ids, token in backend._client.batch_calls] == [
+        (20, None), (20, "15"), (5, None)
+    ]
+    assert backend._client.single_calls == []
+
+
+def test_aws_get_secrets_reports_errors():
+    """Test that per-secret errors from the batch call are raised together"""
+    from envcraft.backends import AWSSecretsBackend
+    
+    backend = AWSSecretsBackend()
+    backend._client = FakeSecretsManagerClient(errors=[
+        {'SecretId': 'missing1', 'Message': 'not found'},
+        {'SecretId': 'missing2', 'Message': 'access denied'},
+    ])
+    
+    with pytest.raises(ValueError) as exc_info:
+        backend.get_secrets(["present", "missing1", "missing2"])
+    
+    assert "'missing1': not found" in str(exc_info.value)
+    assert "'missing2': access denied" in str(exc_info.value)
+
+
+def test_aws_get_secrets_falls_back_for_partial_arns():
+    """Test that full ARNs come from the batch and partial ARNs are fetched one by one"""
+    from envcraft.backends import AWSSecretsBackend
+    
+    full_arn = f"{ARN_PREFIX}full-AbCdEf"
+    partial_arn = f"{ARN_PREFIX}partial"
+    backend = AWSSecretsBackend()
+    backend._client = FakeSecretsManagerClient()
+    
+    values = backend.get_secrets(["byname", full_arn, partial_arn])
+    
+    assert values == {
+        "byname": "value_byname",
+        full_arn: "value_full",
+        partial_arn: f"value_{partial_arn}",
+    }
+    assert backend._client.single_calls == [partial_arn]
+
+
+def test_aws_get_secrets_without_batch_api():
+    """Test that clients from older boto3 releases fall back to one request per key"""
+    from envcraft.backends import AWSSecretsBackend
+    
+    class OldClient:
+        def __init__(self):
+            self.calls = []
+        
+        def get_secret_value(self, SecretId):
+            self.calls.append(SecretId)
+            return {'SecretString': f"value_{SecretId}"}
+    
+    backend = AWSSecretsBackend()
+    backend._client = OldClient()
+    
+    assert backend.get_secrets(["one", "two"]) == {"one": "value_one", "two": "value_two"}
+    assert backend._client.calls == ["one", "two"]
+
+
+def test_default_get_secrets():
+    """Test the default get_secrets falls back to get_secret per key"""
+    backend = EnvBackend()
+    os.environ["BATCH_ONE"] = "1"
+    os.environ["BATCH_TWO"] = "2"
+    
+    assert backend.get_secrets(["BATCH_ONE", "BATCH_TWO"]) == {"BATCH_ONE": "1", "BATCH_TWO": "2"}
+    
+    # Cleanup
+    del os.environ["BATCH_ONE"]
+    del os.environ["BATCH_TWO"]
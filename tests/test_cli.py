@@ -0,0 +1,60 @@
+import pytest
+import subprocess
+import sys
+from envcraft.cli import main, find_config_class
+
+
+def test_help_does_not_import_pydantic():
+    code = (
+        "import sys\n"
+        "from envcraft.cli import main\n"
+        "try:\n"
+        "    main(['--help'])\n"
+        "except SystemExit:\n"
+        "    pass\n"
+        "assert 'pydantic' not in sys.modules\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True, capture_output=True)
+
+
+def test_find_config_class(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(sys, "path", list(sys.path))
+    monkeypatch.delitem(sys.modules, "settings", raising=False)
+    find_config_class.cache_clear()
+    
+    (tmp_path / "settings.py").write_text(
+        "from envcraft import EnvCraft\n"
+        "class Settings(EnvCraft):\n"
+        "    debug: bool = False\n"
+    )
+    
+    config_class = find_config_class()
+    assert config_class is not None
+    assert config_class.__name__ == "Settings"
+    assert find_config_class() is config_class
+    find_config_class.cache_clear()
+
+
+def test_unknown_command():
+    with pytest.raises(SystemExit):
+        main(["bogus"])
+
+
+def test_version(capsys):
+    with pytest.raises(SystemExit) as exc_info:
+        main(["--version"])
+    assert exc_info.value.code == 0
+    assert capsys.readouterr().out.strip() == "envcraft 0.1.0"
+
+
+def test_explain_nested_variable(monkeypatch, capsys):
+    from tests.test_nested import NestedTestConfig
+    import envcraft.cli as cli
+    
+    monkeypatch.setattr(cli, "find_config_class", lambda: NestedTestConfig)
+    main(["explain", "db__pool_size"])
+    
+    out = capsys.readouterr().out
+    assert "DB__POOL_SIZE" in out
+    assert "Default: 10" in out
@@ -29,3 +29,100 @@ def test_generate_example(tmp_path):
     content = output.read_text()
     assert "TEST_VAR" in content
     assert "TEST_INT" in content
+
+
+def test_import_is_lazy():
+    import subprocess
+    import sys
+    code = "import sys, envcraft; assert 'pydantic' not in sys.modules; envcraft.EnvCraft"
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_load_generates_example_per_directory(tmp_path, monkeypatch):
+    first = tmp_path / "first"
+    second = tmp_path / "second"
+    first.mkdir()
+    second.mkdir()
+    
+    monkeypatch.chdir(first)
+    AppTestConfig.load(cache=False)
+    assert (first / ".env.example").exists()
+    
+    monkeypatch.chdir(second)
+    AppTestConfig.load(cache=False)
+    assert (second / ".env.example").exists()
+
+
+def test_diagnose_sees_env_file_values(tmp_path, monkeypatch, capsys):
+    class RequiredConfig(EnvCraft):
+        required_value: str
+    
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.delenv("REQUIRED_VALUE", raising=False)
+    assert RequiredConfig.diagnose() is False
+    assert "REQUIRED_VALUE missing (required)" in capsys.readouterr().out
+    
+    (tmp_path / ".env").write_text("REQUIRED_VALUE=set")
+    assert RequiredConfig.diagnose() is True
+    assert "REQUIRED_VALUE present" in capsys.readouterr().out
+
+
+def test_parsed_env_source_decodes_complex_values(monkeypatch):
+    from typing import List
+    from envcraft.config import _ParsedEnvSource
+    
+    class ComplexConfig(EnvCraft):
+        tags: List[str] = []
+    
+    # Only the given values are read, not os.environ
+    monkeypatch.setenv("TAGS", '["from_environ"]')
+    values = _ParsedEnvSource(ComplexConfig, {"tags": '["a", "b"]'})()
+    assert values == {"tags": ["a", "b"]}
+
+
+def test_parsed_env_source_uses_env_prefix():
+    from pydantic_settings import SettingsConfigDict
+    from envcraft.config import _ParsedEnvSource
+    
+    class PrefixedSourceConfig(EnvCraft):
+        model_config = SettingsConfigDict(env_prefix="APP_")
+        value: str = "default"
+    
+    values = _ParsedEnvSource(PrefixedSourceConfig, {"value": "bare", "app_value": "prefixed"})()
+    assert values == {"value": "prefixed"}
+
+
+def test_env_file_values_honour_empty_and_none_settings(tmp_path, monkeypatch):
+    from typing import Optional
+    from pydantic_settings import SettingsConfigDict
+    from envcraft.config import parse_env_vars
+    
+    if parse_env_vars is None:
+        pytest.skip("pydantic-settings has no env_ignore_empty / env_parse_none_str")
+    
+    class NoneStrConfig(EnvCraft):
+        model_config = SettingsConfigDict(env_ignore_empty=True, env_parse_none_str="null")
+        empty_value: Optional[str] = "default"
+        none_value: Optional[str] = "default"
+    
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / ".env").write_text("EMPTY_VALUE=\nNONE_VALUE=null\n")
+    
+    config = NoneStrConfig.load(cache=False, auto_generate_example=False)
+    assert config.empty_value == "default"
+    assert config.none_value is None
+
+
+def test_case_sensitive_env_file_values(tmp_path, monkeypatch):
+    from pydantic_settings import SettingsConfigDict
+    
+    class CaseSensitiveConfig(EnvCraft):
+        model_config = SettingsConfigDict(case_sensitive=True)
+        API_KEY: str = "default"
+    
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.delenv("API_KEY", raising=False)
+    (tmp_path / ".env.local").write_text("API_KEY=fromfile\napi_key=lowercase\n")
+    
+    config = CaseSensitiveConfig.load(cache=False, auto_generate_example=False)
+    assert config.API_KEY == "fromfile"
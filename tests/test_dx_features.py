@@ -2,7 +2,7 @@ import pytest
 from pathlib import Path
 from envcraft import EnvCraft
 from envcraft.config import _instances, _reload_callbacks
-from pydantic import Field
+from pydantic import Field, field_validator
 import time
 import os
 
@@ -45,6 +45,128 @@ DATABASE_URL=postgresql://${USER}@from_system/mydb
     assert config.database_url == "postgresql://testuser@from_system/mydb"
 
 
+def test_interpolation_across_files(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    
+    (tmp_path / ".env").write_text("""
+USER=testuser
+HOST=localhost
+""")
+    (tmp_path / ".env.local").write_text("""
+# Values from .env are visible here
+DATABASE_URL=postgresql://${USER}@${HOST}/mydb
+""")
+    
+    config = InterpolationTestConfig.load(cache=False, auto_generate_example=False)
+    assert config.database_url == "postgresql://testuser@localhost/mydb"
+
+
+def test_interpolation_forward_reference(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    
+    (tmp_path / ".env").write_text("""
+DATABASE_URL=postgresql://${USER}@${HOST}/mydb
+USER=testuser
+HOST=localhost
+""")
+    
+    config = InterpolationTestConfig.load(cache=False, auto_generate_example=False)
+    assert config.database_url == "postgresql://testuser@localhost/mydb"
+
+
+def test_load_does_not_modify_environ(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.delenv("DATABASE_URL", raising=False)
+    
+    (tmp_path / ".env.local").write_text("""
+USER=testuser
+HOST=localhost
+DATABASE_URL=postgresql://${USER}@${HOST}/mydb
+""")
+    
+    config = InterpolationTestConfig.load(cache=False, auto_generate_example=False)
+    assert config.database_url == "postgresql://testuser@localhost/mydb"
+    assert "DATABASE_URL" not in os.environ
+
+
+def test_env_file_parsing(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    
+    env_file = tmp_path / ".env"
+    env_file.write_bytes(
+        b"# USER=commented\r\n"
+        b"USER = testuser \r\n"
+        b"\r\n"
+        b"HOST=localhost\r\n"
+        b"DATABASE_URL=postgresql://${USER}@${HOST}/mydb?a=b\r\n"
+    )
+    
+    config = InterpolationTestConfig.load(cache=False, auto_generate_example=False)
+    assert config.user == "testuser"
+    assert config.database_url == "postgresql://testuser@localhost/mydb?a=b"
+
+
+def test_env_file_json_values_for_non_scalar_types(tmp_path, monkeypatch):
+    from collections import deque
+    from dataclasses import dataclass
+    
+    @dataclass
+    class Point:
+        x: int
+        y: int
+    
+    class JsonConfig(EnvCraft):
+        point: Point = Point(0, 0)
+        queue: deque = deque()
+    
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / ".env").write_text('POINT={"x": 1, "y": 2}\nQUEUE=[1, 2]\n')
+    
+    config = JsonConfig.load(cache=False, auto_generate_example=False)
+    assert config.point == Point(1, 2)
+    assert config.queue == deque([1, 2])
+
+
+def test_env_file_respects_env_prefix(tmp_path, monkeypatch):
+    from pydantic_settings import SettingsConfigDict
+    
+    class PrefixedFileConfig(EnvCraft):
+        model_config = SettingsConfigDict(env_prefix="APP_")
+        value: str = "default"
+    
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.delenv("APP_VALUE", raising=False)
+    (tmp_path / ".env").write_text("VALUE=unprefixed")
+    assert PrefixedFileConfig.load(cache=False, auto_generate_example=False).value == "default"
+    
+    (tmp_path / ".env").write_text("APP_VALUE=prefixed")
+    assert PrefixedFileConfig.load(cache=False, auto_generate_example=False).value == "prefixed"
+
+
+def test_env_file_scalars_honour_value_settings(tmp_path, monkeypatch):
+    from enum import Enum
+    from pydantic_settings import SettingsConfigDict
+    from envcraft.config import parse_env_vars
+    
+    if parse_env_vars is None:
+        pytest.skip("pydantic-settings has no env_ignore_empty / env_parse_none_str / env_parse_enums")
+    
+    class Color(Enum):
+        RED = "r"
+    
+    class ValueSettingsConfig(EnvCraft):
+        model_config = SettingsConfigDict(env_ignore_empty=True, env_parse_enums=True)
+        empty_value: str = "default"
+        color: Color = Color.RED
+    
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / ".env").write_text("EMPTY_VALUE=\nCOLOR=RED\n")
+    
+    config = ValueSettingsConfig.load(cache=False, auto_generate_example=False)
+    assert config.empty_value == "default"
+    assert config.color is Color.RED
+
+
 class CacheTestConfig(EnvCraft):
     test_value: str = "default"
 
@@ -62,6 +184,48 @@ def test_caching(tmp_path, monkeypatch):
     assert config1 is config2
 
 
+def test_cached_instance_lives_while_referenced(tmp_path, monkeypatch):
+    import gc
+    
+    monkeypatch.chdir(tmp_path)
+    
+    if CacheTestConfig in _instances:
+        del _instances[CacheTestConfig]
+    
+    config = CacheTestConfig.load(auto_generate_example=False)
+    assert CacheTestConfig.load(auto_generate_example=False) is config
+    
+    # The cache holds no strong reference of its own
+    del config
+    gc.collect()
+    assert CacheTestConfig not in _instances
+
+
+def test_concurrent_load_returns_one_instance(tmp_path, monkeypatch):
+    import threading
+    
+    monkeypatch.chdir(tmp_path)
+    
+    if CacheTestConfig in _instances:
+        del _instances[CacheTestConfig]
+    
+    results = []
+    start = threading.Barrier(8)
+    
+    def worker():
+        start.wait()
+        results.append(CacheTestConfig.load(auto_generate_example=False))
+    
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    
+    assert len(results) == 8
+    assert all(config is results[0] for config in results)
+
+
 def test_reload(tmp_path, monkeypatch):
     monkeypatch.chdir(tmp_path)
     
@@ -109,6 +273,102 @@ def test_reload_callbacks(tmp_path, monkeypatch):
     assert "reloaded" in callback_called
 
 
+def test_on_reload_rejects_non_callable():
+    with pytest.raises(TypeError):
+        CacheTestConfig.on_reload("not a function")
+
+
+def test_load_with_env_file(tmp_path, monkeypatch):
+    from envcraft.config import _env_paths
+    
+    class EnvFileConfig(EnvCraft):
+        test_value: str = "default"
+    
+    config_dir = tmp_path / "conf"
+    config_dir.mkdir()
+    (config_dir / "app.env").write_text("TEST_VALUE=from_file")
+    (config_dir / "app.env.local").write_text("TEST_VALUE=from_local")
+    
+    monkeypatch.chdir(tmp_path)
+    config = EnvFileConfig.load(env_file="conf/app.env", auto_generate_example=False)
+    assert config.test_value == "from_local"
+    assert EnvFileConfig in _env_paths
+    
+    # reload() keeps using the resolved path after the working directory changes
+    other = tmp_path / "other"
+    other.mkdir()
+    monkeypatch.chdir(other)
+    (config_dir / "app.env.local").unlink()
+    assert EnvFileConfig.reload().test_value == "from_file"
+
+
+def test_changing_env_file_drops_cached_instance(tmp_path, monkeypatch):
+    class SwitchFileConfig(EnvCraft):
+        test_value: str = "default"
+    
+    (tmp_path / ".env").write_text("TEST_VALUE=cwd")
+    (tmp_path / "prod.env").write_text("TEST_VALUE=prod")
+    monkeypatch.chdir(tmp_path)
+    
+    config = SwitchFileConfig.load(auto_generate_example=False)
+    assert config.test_value == "cwd"
+    
+    prod = SwitchFileConfig.load(env_file="prod.env", auto_generate_example=False)
+    assert prod.test_value == "prod"
+    assert SwitchFileConfig.load(auto_generate_example=False) is prod
+    
+    SwitchFileConfig.reset_env_file()
+    assert SwitchFileConfig.load(auto_generate_example=False).test_value == "cwd"
+
+
+def test_unchanged_env_file_is_not_reparsed(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    
+    env_file = tmp_path / ".env"
+    env_file.write_text("TEST_VALUE=aaaa")
+    settled = time.time() - 60
+    os.utime(env_file, (settled, settled))
+    assert CacheTestConfig.load(cache=False, auto_generate_example=False).test_value == "aaaa"
+    
+    # Same size and mtime: the cached parse is used
+    env_file.write_text("TEST_VALUE=bbbb")
+    os.utime(env_file, (settled, settled))
+    assert CacheTestConfig.load(cache=False, auto_generate_example=False).test_value == "aaaa"
+    
+    # A new mtime is picked up
+    os.utime(env_file, (settled + 1, settled + 1))
+    assert CacheTestConfig.load(cache=False, auto_generate_example=False).test_value == "bbbb"
+
+
+def test_load_with_missing_env_file_directory(tmp_path, monkeypatch):
+    class MissingDirConfig(EnvCraft):
+        test_value: str = "default"
+    
+    monkeypatch.chdir(tmp_path)
+    config = MissingDirConfig.load(env_file="missing/.env", cache=False, auto_generate_example=False)
+    assert config.test_value == "default"
+
+
+def test_parse_cache_keeps_only_last_used_files(tmp_path, monkeypatch):
+    from envcraft.config import _parsed_files
+    
+    monkeypatch.chdir(tmp_path)
+    settled = time.time() - 60
+    for name in ("first", "second"):
+        (tmp_path / name).mkdir()
+        env_file = tmp_path / name / ".env"
+        env_file.write_text(f"TEST_VALUE={name}")
+        os.utime(env_file, (settled, settled))
+    
+    monkeypatch.chdir(tmp_path / "first")
+    assert CacheTestConfig.load(cache=False, auto_generate_example=False).test_value == "first"
+    assert len(_parsed_files[CacheTestConfig]) == 1
+    
+    monkeypatch.chdir(tmp_path / "second")
+    assert CacheTestConfig.load(cache=False, auto_generate_example=False).test_value == "second"
+    assert len(_parsed_files[CacheTestConfig]) == 1
+
+
 def test_no_cache(tmp_path, monkeypatch):
     monkeypatch.chdir(tmp_path)
     
@@ -122,6 +382,134 @@ def test_no_cache(tmp_path, monkeypatch):
     assert config1 is not config2
 
 
+class ValidationCountConfig(EnvCraft):
+    counted: str = "default"
+    
+    @field_validator('counted')
+    @classmethod
+    def count_validation(cls, v: str) -> str:
+        validation_calls.append(v)
+        return v
+
+
+validation_calls = []
+
+
+def test_unchanged_inputs_skip_validation(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.delenv("COUNTED", raising=False)
+    validation_calls.clear()
+    
+    env_file = tmp_path / ".env"
+    env_file.write_text("COUNTED=first")
+    
+    config1 = ValidationCountConfig.load(cache=False, auto_generate_example=False)
+    config2 = ValidationCountConfig.load(cache=False, auto_generate_example=False)
+    assert config1 is not config2
+    assert config2.counted == "first"
+    assert config2._source_map == {"counted": ".env"}
+    assert validation_calls == ["first"]
+    
+    # Changed inputs are validated again
+    env_file.write_text("COUNTED=second")
+    config3 = ValidationCountConfig.load(cache=False, auto_generate_example=False)
+    assert config3.counted == "second"
+    assert validation_calls == ["first", "second"]
+
+
+def test_skipped_validation_does_not_share_values(tmp_path, monkeypatch):
+    from typing import List
+    
+    class MutableConfig(EnvCraft):
+        tags: List[str] = ["a"]
+    
+    monkeypatch.chdir(tmp_path)
+    config1 = MutableConfig.load(cache=False, auto_generate_example=False)
+    config1.tags.append("changed")
+    
+    config2 = MutableConfig.load(cache=False, auto_generate_example=False)
+    config2.tags.append("changed again")
+    assert MutableConfig.load(cache=False, auto_generate_example=False).tags == ["a"]
+
+
+def test_prefixed_and_aliased_env_changes_are_seen(tmp_path, monkeypatch):
+    from pydantic_settings import SettingsConfigDict
+    
+    class PrefixedConfig(EnvCraft):
+        model_config = SettingsConfigDict(env_prefix="APP_")
+        value: str = "default"
+    
+    class AliasedConfig(EnvCraft):
+        value: str = Field("default", validation_alias="OTHER_VALUE")
+    
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("APP_VALUE", "first")
+    monkeypatch.setenv("OTHER_VALUE", "first")
+    assert PrefixedConfig.load(cache=False, auto_generate_example=False).value == "first"
+    assert AliasedConfig.load(cache=False, auto_generate_example=False).value == "first"
+    
+    monkeypatch.setenv("APP_VALUE", "second")
+    monkeypatch.setenv("OTHER_VALUE", "second")
+    assert PrefixedConfig.load(cache=False, auto_generate_example=False).value == "second"
+    assert AliasedConfig.load(cache=False, auto_generate_example=False).value == "second"
+
+
+def test_skipped_validation_keeps_extra_fields(tmp_path, monkeypatch):
+    from pydantic_settings import SettingsConfigDict
+    
+    class ExtraConfig(EnvCraft):
+        model_config = SettingsConfigDict(extra="allow")
+        value: str = "default"
+    
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.delenv("VALUE", raising=False)
+    (tmp_path / ".env").write_text("VALUE=x\nOTHER=1\n")
+    
+    first = ExtraConfig.load(cache=False, auto_generate_example=False).model_dump()
+    second = ExtraConfig.load(cache=False, auto_generate_example=False).model_dump()
+    assert first == second == {"value": "x", "other": "1"}
+
+
+def test_lines_only_pydantic_reads_are_fingerprinted(tmp_path, monkeypatch):
+    class ExportConfig(EnvCraft):
+        exported: str = "default"
+    
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.delenv("EXPORTED", raising=False)
+    env_file = tmp_path / ".env"
+    
+    env_file.write_text("export EXPORTED=one\n")
+    assert ExportConfig.load(cache=False, auto_generate_example=False).exported == "one"
+    
+    env_file.write_text("export EXPORTED=two\n")
+    assert ExportConfig.load(cache=False, auto_generate_example=False).exported == "two"
+
+
+def test_custom_sources_skip_validated_values(tmp_path, monkeypatch):
+    import json
+    
+    source_file = tmp_path / "settings.json"
+    
+    def json_source():
+        return json.loads(source_file.read_text())
+    
+    class CustomSourceConfig(EnvCraft):
+        value: str = "default"
+        
+        @classmethod
+        def settings_customise_sources(cls, settings_cls, init_settings, env_settings, dotenv_settings, file_secret_settings):
+            return init_settings, json_source, env_settings, dotenv_settings
+    
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.delenv("VALUE", raising=False)
+    
+    source_file.write_text('{"value": "one"}')
+    assert CustomSourceConfig.load(cache=False, auto_generate_example=False).value == "one"
+    
+    source_file.write_text('{"value": "two"}')
+    assert CustomSourceConfig.load(cache=False, auto_generate_example=False).value == "two"
+
+
 class SuggestionTestConfig(EnvCraft):
     database_url: str = Field(...)
     api_key: str = Field(...)
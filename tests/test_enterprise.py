@@ -28,6 +28,21 @@ UNKNOWN_VAR=should_fail
         StrictTestConfig.load(strict=True, cache=False, auto_generate_example=False)
 
 
+def test_strict_mode_suggests_known_vars(monkeypatch, tmp_path):
+    monkeypatch.chdir(tmp_path)
+    
+    env_file = tmp_path / ".env"
+    env_file.write_text("KNOWN_VARR=value\n")
+    
+    with pytest.raises(ValueError) as exc_info:
+        StrictTestConfig.load(strict=True, cache=False, auto_generate_example=False)
+    
+    hints = getattr(exc_info.value, '__notes__', [str(exc_info.value)])
+    assert any("KNOWN_VAR" in hint for hint in hints)
+    # The failed strict load must not leave the class in strict mode
+    assert StrictTestConfig.model_config.get('extra') == 'ignore'
+
+
 def test_generate_docs(tmp_path, monkeypatch):
     monkeypatch.chdir(tmp_path)
     
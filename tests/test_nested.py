@@ -64,3 +64,44 @@ def test_nested_generate_example(tmp_path, monkeypatch):
     assert "DB__POOL_SIZE" in content
     assert "DEBUG" in content
     assert "(nested)" in content
+
+
+def test_nested_config_strict_mode(monkeypatch, tmp_path):
+    monkeypatch.chdir(tmp_path)
+    
+    env_file = tmp_path / ".env"
+    env_file.write_text("""
+DB__URL=postgresql://localhost/test
+DB__POOL_SIZE=20
+""")
+    
+    config = NestedTestConfig.load(strict=True, cache=False, auto_generate_example=False)
+    assert config.db.pool_size == 20
+
+
+def test_reload_reuses_unchanged_nested_model(monkeypatch, tmp_path):
+    monkeypatch.chdir(tmp_path)
+    
+    for key in list(os.environ.keys()):
+        if key.startswith('DB__') or key == 'DEBUG':
+            monkeypatch.delenv(key, raising=False)
+    
+    env_file = tmp_path / ".env"
+    env_file.write_text("DB__URL=postgresql://localhost/test\nDEBUG=false\n")
+    config1 = NestedTestConfig.load(cache=False, auto_generate_example=False)
+    
+    # Only a top-level value changed, the nested model is reused as a copy
+    env_file.write_text("DB__URL=postgresql://localhost/test\nDEBUG=true\n")
+    config2 = NestedTestConfig.load(cache=False, auto_generate_example=False)
+    assert config2.debug is True
+    assert config2.db == config1.db
+    
+    # Configs don't share the nested model
+    config1.db.url = "postgresql://localhost/mutated"
+    assert config2.db.url == "postgresql://localhost/test"
+    
+    # A nested value changed, the nested model is rebuilt
+    env_file.write_text("DB__URL=postgresql://localhost/other\nDEBUG=true\n")
+    config3 = NestedTestConfig.load(cache=False, auto_generate_example=False)
+    assert config3.db.url == "postgresql://localhost/other"
+    assert config3.db != config2.db